@@ -1,15 +1,308 @@
 import csv
-import random
 import datetime
+import io
 import math
+import multiprocessing
 import os
+import re
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkinter import simpledialog
 
-class DataMakerGUI:
-    def __init__(self):
-        self.root = tk.Tk()
+# Component specifications stored as parallel columns (one entry per component)
+COMP_NAMES = ("Blade", "Gearbox", "Generator", "Transformer", "Control_System", "Yaw_System")
+COMP_KEYS = ("blade", "gearbox", "generator", "transformer", "control_system", "yaw_system")
+COMP_SERIAL_PREFIX = ("BL", "GB", "GN", "TR", "CS", "YS")
+COMP_CRITICALITY = ("critical", "critical", "critical", "important", "important", "routine")
+COMP_POWER_IMPACT = np.array([0.95, 1.0, 1.0, 1.0, 0.2, 0.1])
+COMP_REPAIR_HOURS = np.array([48, 72, 60, 36, 24, 18])
+SALVAGE_FRACTION = 0.1
+
+# Output schema, one column per field
+CSV_HEADER = (
+    "Node_ID", "Latitude", "Longitude", "Water_Depth", "Power_Rating", 
+    "Current_Output", "Energy_Price_MWh", "Cluster_Name",
+    "Component_Name", "Lifetime_Years", "Serial_Number", "Installation_Date",
+    "Replacement_Cost", "Salvage_Value", "Criticality_Level", 
+    "Power_Impact_Factor", "Repair_Hours"
+)
+CSV_HEADER_LINE = ",".join(CSV_HEADER) + "\n"
+
+# Wind farm cluster names and (latitude, longitude) centers, in selection order
+CLUSTER_NAMES = (
+    "North Sea Alpha", "North Sea Beta", "Baltic Wind", 
+    "Atlantic Storm", "Celtic Sea", "Norwegian Deep"
+)
+BASE_COORDS = (
+    (54.5, 2.0), (55.2, 1.5), (55.8, 15.2),
+    (52.0, -4.0), (51.5, -5.0), (60.0, 2.0)
+)
+
+# (label, entry key) pairs for the per-component input sections
+LIFETIME_FIELDS = (
+    ('Blade Lifetime:', 'blade_lifetime'),
+    ('Gearbox Lifetime:', 'gearbox_lifetime'),
+    ('Generator Lifetime:', 'generator_lifetime'),
+    ('Transformer Lifetime:', 'transformer_lifetime'),
+    ('Control System Lifetime:', 'control_system_lifetime'),
+    ('Yaw System Lifetime:', 'yaw_system_lifetime')
+)
+COST_FIELDS = (
+    ('Blade Cost:', 'blade_cost'),
+    ('Gearbox Cost:', 'gearbox_cost'),
+    ('Generator Cost:', 'generator_cost'),
+    ('Transformer Cost:', 'transformer_cost'),
+    ('Control System Cost:', 'control_system_cost'),
+    ('Yaw System Cost:', 'yaw_system_cost')
+)
+
+# Characters that are not allowed in the output file name
+_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Component input sections: (section title, fields) in display order
+FIELD_SPEC = (
+    ("Component Lifetime (Years)", LIFETIME_FIELDS),
+    ("Component Replacement Cost ($)", COST_FIELDS)
+)
+
+# Fonts used by the generator window
+_FONT_TITLE = ("Arial", 14, "bold")
+_FONT_SECTION = ("Arial", 12, "bold")
+_FONT_BOLD = ("Arial", 10, "bold")
+
+# One formatted CSV line per (turbine, component) row tuple
+ROW_FMT = "%s,%.6f,%.6f,%.1f,%.1f,%.3f,%.3f,%s,%s,%d,%s,%s,%.0f,%.0f,%s,%.2f,%d\n"
+
+# Turbine count above which generation is spread over worker processes
+PARALLEL_MIN_TURBINES = 10_000
+# Fixed number of independently seeded chunks for large datasets, so the output
+# for a given seed does not depend on how many workers format them
+PARALLEL_CHUNKS = 64
+
+class WindFarmGenerator:
+    """Generates synthetic wind farm turbine/component data and writes it to CSV."""
+    def __init__(self, seed=None):
+        # Single random generator shared by all batched draws
+        self.rng = np.random.default_rng(seed)
+    
+    def generate_clustered_coordinates(self, center_lat, center_lon, lon_spread_per_km,
+                                       lat_unit, lon_unit, spread_km=10):
+        """Generate coordinates within clusters with realistic spread.
+        
+        Works element-wise on arrays; lat_unit and lon_unit are pre-drawn
+        offsets in [-1, 1).
+        """
+        lat_spread = spread_km / 111.0
+        lon_spread = spread_km * lon_spread_per_km
+        
+        latitude = center_lat + lat_unit * lat_spread
+        longitude = center_lon + lon_unit * lon_spread
+        return latitude, longitude
+    
+    def calculate_water_depth(self, latitude, longitude, noise):
+        """Simulate water depth based on distance from shore"""
+        distance_factor = np.abs(latitude - 54.0) + np.abs(longitude - 1.0)
+        base_depth = 20 + (distance_factor * 5)
+        return np.round(base_depth + noise, 1)
+    
+    def generate_turbine_data(self, num_turbines):
+        """Generate realistic turbine specifications for all turbines at once"""
+        power_ratings = [2.0, 3.0, 3.6, 5.0, 6.0, 8.0]
+        power_rating = self.rng.choice(power_ratings, num_turbines)
+        current_output_factor = self.rng.uniform(0.7, 1.0, num_turbines)
+        
+        return {
+            "power_rating": power_rating,
+            "current_output": power_rating * current_output_factor,
+            "energy_price_mwh": self.rng.uniform(45, 65, num_turbines)
+        }
+    
+    def _build_numeric_columns(self, wind_farm_clusters, num_turbines, num_components,
+                               base_installation_ordinal):
+        """Compute every numeric column of the dataset as whole arrays.
+        
+        Returns a dict of per-turbine arrays plus a (turbines, components)
+        array of installation day ordinals.
+        """
+        rng = self.rng
+        
+        # Per-cluster properties as arrays, gathered by a sampled cluster index
+        centers_lat = np.array([c["center_lat"] for c in wind_farm_clusters])
+        centers_lon = np.array([c["center_lon"] for c in wind_farm_clusters])
+        lon_spreads = np.array([c["lon_spread_per_km"] for c in wind_farm_clusters])
+        
+        # Draw all randomness up front, one vectorized call per distribution
+        cluster_idx = rng.integers(0, len(wind_farm_clusters), num_turbines)
+        lat_units = rng.uniform(-1, 1, num_turbines)
+        lon_units = rng.uniform(-1, 1, num_turbines)
+        depth_noise = rng.uniform(-5, 15, num_turbines)
+        
+        latitudes, longitudes = self.generate_clustered_coordinates(
+            centers_lat[cluster_idx], centers_lon[cluster_idx], lon_spreads[cluster_idx],
+            lat_units, lon_units
+        )
+        columns = {
+            "cluster_idx": cluster_idx,
+            "latitude": latitudes,
+            "longitude": longitudes,
+            "water_depth": self.calculate_water_depth(latitudes, longitudes, depth_noise)
+        }
+        columns.update(self.generate_turbine_data(num_turbines))
+        
+        # Some components have been replaced since the base installation date
+        shape = (num_turbines, num_components)
+        install_jitter = rng.integers(-90, 91, shape)
+        replace_mask = rng.random(shape) < 0.2
+        replace_days = rng.integers(365, 3*365 + 1, shape)
+        install_offsets = np.where(replace_mask, replace_days, install_jitter)
+        columns["install_ordinal"] = base_installation_ordinal + install_offsets
+        return columns
+    
+    def stream_rows(self, wind_farm_clusters, component_specs, base_installation_date,
+                    num_turbines=25, first_turbine=0):
+        """Yield one CSV row tuple per (turbine, component) pair.
+        
+        Turbines are numbered from first_turbine + 1 so that chunks generated
+        separately can be concatenated.
+        """
+        num_components = len(component_specs["name"])
+        
+        # The spec fields are identical for every turbine, so zip the columns
+        # once into the row fragments that sit before and after the
+        # per-turbine serial number and installation date
+        serial_prefixes = list(component_specs["serial_prefix"])
+        comp_heads = list(zip(
+            component_specs["name"],
+            np.asarray(component_specs["lifetime_years"]).tolist()
+        ))
+        comp_tails = list(zip(
+            np.asarray(component_specs["replacement_cost"]).tolist(),
+            np.asarray(component_specs["salvage_value"]).tolist(),
+            component_specs["criticality_level"],
+            np.asarray(component_specs["power_impact_factor"]).tolist(),
+            np.asarray(component_specs["repair_hours"]).tolist()
+        ))
+        
+        columns = self._build_numeric_columns(
+            wind_farm_clusters, num_turbines, num_components,
+            base_installation_date.toordinal()
+        )
+        latitudes = columns["latitude"].tolist()
+        longitudes = columns["longitude"].tolist()
+        water_depths = columns["water_depth"].tolist()
+        power_ratings = columns["power_rating"].tolist()
+        current_outputs = columns["current_output"].tolist()
+        energy_prices = columns["energy_price_mwh"].tolist()
+        cluster_names = [c["name"] for c in wind_farm_clusters]
+        turbine_cluster_names = [cluster_names[k] for k in columns["cluster_idx"].tolist()]
+        
+        # Format each distinct date once so the writer only sees ready strings
+        unique_ords, inverse = np.unique(columns["install_ordinal"], return_inverse=True)
+        iso_dates = np.array([datetime.date.fromordinal(o).isoformat()
+                              for o in unique_ords.tolist()])
+        install_dates = iso_dates[inverse.reshape(num_turbines, num_components)].tolist()
+        
+        for i in range(num_turbines):
+            turbine_number = first_turbine + i + 1
+            node_id = f"WTG_{turbine_number:02d}"
+            node_fields = (node_id, latitudes[i], longitudes[i], water_depths[i],
+                           power_ratings[i], current_outputs[i], energy_prices[i],
+                           turbine_cluster_names[i])
+            
+            turbine_dates = install_dates[i]
+            for j in range(num_components):
+                serial_number = "%s%02d" % (serial_prefixes[j], turbine_number)
+                yield (node_fields + comp_heads[j]
+                       + (serial_number, turbine_dates[j]) + comp_tails[j])
+    
+    def write_csv(self, rows, filename, safe=False, durable=False):
+        """Write the generated rows to a CSV file.
+        
+        Every field in this schema is numeric, an ISO date or a fixed ASCII
+        label, so rows are formatted with ROW_FMT and streamed into the file's
+        1 MiB write buffer.
+        Pass safe=True to go through csv.writer with full quoting rules, and
+        durable=True to fsync the file to disk before it is closed.
+        """
+        with open(filename, mode='w', newline='', buffering=1 << 20) as file:
+            if safe:
+                writer = csv.writer(file)
+                writer.writerow(CSV_HEADER)
+                writer.writerows(rows)
+            else:
+                file.write(CSV_HEADER_LINE)
+                file.writelines(ROW_FMT % row for row in rows)
+            
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+    
+    def write_dataset(self, filename, wind_farm_clusters, component_specs,
+                      base_installation_date, num_turbines=25, n_workers=None,
+                      safe=False, durable=False):
+        """Generate num_turbines turbines and write them to filename.
+        
+        Above PARALLEL_MIN_TURBINES the turbines are split into PARALLEL_CHUNKS
+        chunks, each with its own random stream spawned from this generator,
+        and formatted by up to n_workers processes (default: one per CPU).
+        safe and durable have the same meaning as for write_csv.
+        """
+        if num_turbines <= PARALLEL_MIN_TURBINES:
+            rows = self.stream_rows(
+                wind_farm_clusters, component_specs, base_installation_date, num_turbines
+            )
+            self.write_csv(rows, filename, safe=safe, durable=durable)
+            return
+        
+        seeds = np.random.SeedSequence(int(self.rng.integers(2**63))).spawn(PARALLEL_CHUNKS)
+        chunks = np.array_split(np.arange(num_turbines), PARALLEL_CHUNKS)
+        tasks = [
+            (seed, wind_farm_clusters, component_specs, base_installation_date,
+             int(chunk[0]), len(chunk), safe)
+            for seed, chunk in zip(seeds, chunks) if len(chunk)
+        ]
+        n_workers = min(n_workers or os.cpu_count() or 1, len(tasks))
+        
+        with open(filename, mode='w', newline='', buffering=1 << 20) as file:
+            if safe:
+                csv.writer(file).writerow(CSV_HEADER)
+            else:
+                file.write(CSV_HEADER_LINE)
+            
+            # Chunks are written in order as they finish, so at most a few are held at once
+            if n_workers > 1:
+                with multiprocessing.Pool(n_workers) as pool:
+                    file.writelines(pool.imap(_format_turbine_chunk, tasks))
+            else:
+                file.writelines(map(_format_turbine_chunk, tasks))
+            
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+
+
+def _format_turbine_chunk(task):
+    """Worker for WindFarmGenerator.write_dataset: format one chunk of turbines."""
+    (seed, wind_farm_clusters, component_specs, base_installation_date,
+     first, count, safe) = task
+    generator = WindFarmGenerator(seed)
+    rows = generator.stream_rows(
+        wind_farm_clusters, component_specs, base_installation_date, count, first
+    )
+    if safe:
+        buffer = io.StringIO(newline='')
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    return "".join([ROW_FMT % row for row in rows])
+
+
+class DataMakerGUI(WindFarmGenerator):
+    def __init__(self, parent=None):
+        super().__init__()
+        # Opened from another Tk window it becomes a Toplevel of that app
+        # instead of bringing up a second Tk interpreter and event loop
+        self.parent = parent
+        self.root = tk.Toplevel(parent) if parent is not None else tk.Tk()
         self.root.title("Wind Farm Data Generator")
         self.root.geometry("500x700")
         
@@ -36,23 +329,30 @@ class DataMakerGUI:
         }
         
         self.entries = {}
+        
+        # Build the widgets while the window is hidden, then lay it out once
+        self.root.withdraw()
         self.create_widgets()
+        self.root.update_idletasks()
+        self.root.deiconify()
         
     def create_widgets(self):
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
         
         # Title
         title_label = ttk.Label(main_frame, text="Wind Farm Data Generator", 
-                               font=("Arial", 14, "bold"))
+                               font=_FONT_TITLE)
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         row = 1
         
         # Filename Field
         ttk.Label(main_frame, text="File Name (without .csv):", 
-                 font=('Arial', 10, 'bold')).grid(row=row, column=0, sticky=tk.W, pady=5)
+                 font=_FONT_BOLD).grid(row=row, column=0, sticky=tk.W, pady=5)
         self.entries['filename'] = ttk.Entry(main_frame, width=20)
         self.entries['filename'].grid(row=row, column=1, sticky=tk.W, pady=5)
         self.entries['filename'].insert(0, self.default_values['filename'])
@@ -76,55 +376,15 @@ class DataMakerGUI:
         self.entries['num_clusters'].insert(0, str(self.default_values['num_clusters']))
         row += 1
         
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        row += 1
-        
-        # Lifetime Years Section
-        ttk.Label(main_frame, text="Component Lifetime (Years)", 
-                 font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-        
-        lifetime_components = [
-            ('Blade Lifetime:', 'blade_lifetime'),
-            ('Gearbox Lifetime:', 'gearbox_lifetime'),
-            ('Generator Lifetime:', 'generator_lifetime'),
-            ('Transformer Lifetime:', 'transformer_lifetime'),
-            ('Control System Lifetime:', 'control_system_lifetime'),
-            ('Yaw System Lifetime:', 'yaw_system_lifetime')
-        ]
-        
-        for label_text, key in lifetime_components:
-            ttk.Label(main_frame, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=2)
-            self.entries[key] = ttk.Entry(main_frame, width=20)
-            self.entries[key].grid(row=row, column=1, sticky=tk.W, pady=2)
-            self.entries[key].insert(0, str(self.default_values[key]))
+        # Component sections (lifetimes, then replacement costs)
+        for section_title, fields in FIELD_SPEC:
+            ttk.Separator(main_frame, orient='horizontal').grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
             row += 1
-        
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        row += 1
-        
-        # Replacement Cost Section
-        ttk.Label(main_frame, text="Component Replacement Cost ($)", 
-                 font=("Arial", 12, "bold")).grid(row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-        
-        cost_components = [
-            ('Blade Cost:', 'blade_cost'),
-            ('Gearbox Cost:', 'gearbox_cost'),
-            ('Generator Cost:', 'generator_cost'),
-            ('Transformer Cost:', 'transformer_cost'),
-            ('Control System Cost:', 'control_system_cost'),
-            ('Yaw System Cost:', 'yaw_system_cost')
-        ]
-        
-        for label_text, key in cost_components:
-            ttk.Label(main_frame, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=2)
-            self.entries[key] = ttk.Entry(main_frame, width=20)
-            self.entries[key].grid(row=row, column=1, sticky=tk.W, pady=2)
-            self.entries[key].insert(0, str(self.default_values[key]))
+            
+            ttk.Label(main_frame, text=section_title, 
+                     font=_FONT_SECTION).grid(row=row, column=0, columnspan=2, pady=(10, 5))
             row += 1
+            row = self._make_rows(main_frame, row, fields)
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -142,6 +402,18 @@ class DataMakerGUI:
         cancel_button = ttk.Button(button_frame, text="Cancel", command=self.root.destroy)
         cancel_button.grid(row=0, column=2, padx=5)
         
+    def _make_rows(self, frame, start_row, fields):
+        """Create a label/entry row per (label, key) field; return the next free row"""
+        row = start_row
+        for label_text, key in fields:
+            ttk.Label(frame, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=2)
+            entry = ttk.Entry(frame, width=20)
+            entry.grid(row=row, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, str(self.default_values[key]))
+            self.entries[key] = entry
+            row += 1
+        return row
+    
     def clear_values(self):
         """Clear all input fields to default values"""
         for key, entry in self.entries.items():
@@ -160,14 +432,13 @@ class DataMakerGUI:
                 raise ValueError("File name is required")
             
             # Check for invalid characters in filename
-            invalid_chars = '<>:"/\\|?*'
-            if any(char in filename for char in invalid_chars):
+            if _FORBIDDEN_RE.search(filename):
                 raise ValueError("File name contains invalid characters")
             
             # Validate installation date
-            installation_date = datetime.datetime.strptime(
-                self.entries['installation_date'].get(), '%Y-%m-%d'
-            ).date()
+            installation_date = datetime.date.fromisoformat(
+                self.entries['installation_date'].get()
+            )
             
             # Validate number of clusters
             num_clusters = int(self.entries['num_clusters'].get())
@@ -176,16 +447,14 @@ class DataMakerGUI:
             
             # Validate lifetime years
             lifetimes = {}
-            for key in ['blade_lifetime', 'gearbox_lifetime', 'generator_lifetime', 
-                       'transformer_lifetime', 'control_system_lifetime', 'yaw_system_lifetime']:
+            for _, key in LIFETIME_FIELDS:
                 lifetimes[key] = int(self.entries[key].get())
                 if lifetimes[key] < 1 or lifetimes[key] > 50:
                     raise ValueError(f"{key.replace('_', ' ').title()} must be between 1 and 50 years")
             
             # Validate costs
             costs = {}
-            for key in ['blade_cost', 'gearbox_cost', 'generator_cost', 
-                       'transformer_cost', 'control_system_cost', 'yaw_system_cost']:
+            for _, key in COST_FIELDS:
                 costs[key] = float(self.entries[key].get())
                 if costs[key] < 0:
                     raise ValueError(f"{key.replace('_', ' ').title()} must be non-negative")
@@ -215,224 +484,66 @@ class DataMakerGUI:
                 return  # User chose not to overwrite
         
         # Generate wind farm clusters
-        cluster_names = [
-            "North Sea Alpha", "North Sea Beta", "Baltic Wind", 
-            "Atlantic Storm", "Celtic Sea", "Norwegian Deep"
-        ]
-        
         wind_farm_clusters = []
         for i in range(num_clusters):
-            if i < len(cluster_names):
-                name = cluster_names[i]
+            if i < len(CLUSTER_NAMES):
+                name = CLUSTER_NAMES[i]
             else:
                 name = f"Cluster_{i+1}"
             
-            # Generate cluster coordinates
-            base_coords = [
-                (54.5, 2.0), (55.2, 1.5), (55.8, 15.2),
-                (52.0, -4.0), (51.5, -5.0), (60.0, 2.0)
-            ]
-            
-            if i < len(base_coords):
-                center_lat, center_lon = base_coords[i]
+            if i < len(BASE_COORDS):
+                center_lat, center_lon = BASE_COORDS[i]
             else:
-                center_lat = 50.0 + random.uniform(0, 10)
-                center_lon = random.uniform(-10, 20)
+                center_lat = 50.0 + self.rng.uniform(0, 10)
+                center_lon = self.rng.uniform(-10, 20)
             
             wind_farm_clusters.append({
                 "name": name,
                 "center_lat": center_lat,
-                "center_lon": center_lon
+                "center_lon": center_lon,
+                # Degrees of longitude per km shrink with cos(latitude)
+                "lon_spread_per_km": 1.0 / (111.0 * math.cos(math.radians(center_lat)))
             })
         
-        # Component specifications with user inputs
+        # Component specifications with user inputs, one column per field
+        replacement_costs = np.array([costs[f"{key}_cost"] for key in COMP_KEYS])
         component_specs = {
-            "Blade": {
-                "lifetime_years": lifetimes['blade_lifetime'],
-                "replacement_cost": costs['blade_cost'],
-                "salvage_value": costs['blade_cost'] * 0.1,
-                "criticality_level": "critical",
-                "power_impact_factor": 0.95,
-                "repair_hours": 48
-            },
-            "Gearbox": {
-                "lifetime_years": lifetimes['gearbox_lifetime'],
-                "replacement_cost": costs['gearbox_cost'],
-                "salvage_value": costs['gearbox_cost'] * 0.1,
-                "criticality_level": "critical",
-                "power_impact_factor": 1.0,
-                "repair_hours": 72
-            },
-            "Generator": {
-                "lifetime_years": lifetimes['generator_lifetime'],
-                "replacement_cost": costs['generator_cost'],
-                "salvage_value": costs['generator_cost'] * 0.1,
-                "criticality_level": "critical",
-                "power_impact_factor": 1.0,
-                "repair_hours": 60
-            },
-            "Transformer": {
-                "lifetime_years": lifetimes['transformer_lifetime'],
-                "replacement_cost": costs['transformer_cost'],
-                "salvage_value": costs['transformer_cost'] * 0.1,
-                "criticality_level": "important",
-                "power_impact_factor": 1.0,
-                "repair_hours": 36
-            },
-            "Control_System": {
-                "lifetime_years": lifetimes['control_system_lifetime'],
-                "replacement_cost": costs['control_system_cost'],
-                "salvage_value": costs['control_system_cost'] * 0.1,
-                "criticality_level": "important",
-                "power_impact_factor": 0.2,
-                "repair_hours": 24
-            },
-            "Yaw_System": {
-                "lifetime_years": lifetimes['yaw_system_lifetime'],
-                "replacement_cost": costs['yaw_system_cost'],
-                "salvage_value": costs['yaw_system_cost'] * 0.1,
-                "criticality_level": "routine",
-                "power_impact_factor": 0.1,
-                "repair_hours": 18
-            }
+            "name": COMP_NAMES,
+            "serial_prefix": COMP_SERIAL_PREFIX,
+            "lifetime_years": np.array([lifetimes[f"{key}_lifetime"] for key in COMP_KEYS]),
+            "replacement_cost": replacement_costs,
+            "salvage_value": replacement_costs * SALVAGE_FRACTION,
+            "criticality_level": COMP_CRITICALITY,
+            "power_impact_factor": COMP_POWER_IMPACT,
+            "repair_hours": COMP_REPAIR_HOURS
         }
         
-        # Generate the data
-        nodes_data = self.generate_nodes_data(
-            wind_farm_clusters, component_specs, installation_date
+        # Generate the data and write it to CSV
+        num_turbines = 25
+        self.write_dataset(
+            csv_filename, wind_farm_clusters, component_specs, installation_date, num_turbines
         )
         
-        # Write to CSV
-        self.write_csv(nodes_data, csv_filename)
-        
         # Store the generated filename
         self.last_generated_file = csv_filename
         
         # Success message
         messagebox.showinfo("Success", 
-                           f"CSV file '{csv_filename}' has been created with {len(nodes_data)} turbines.\n"
-                           f"Total components: {sum(len(node['components']) for node in nodes_data)}\n"
+                           f"CSV file '{csv_filename}' has been created with {num_turbines} turbines.\n"
+                           f"Total components: {num_turbines * len(component_specs['name'])}\n"
                            f"Wind farm clusters: {[cluster['name'] for cluster in wind_farm_clusters]}")
         
-        # Ensure window is properly closed
-        self.root.quit()
+        # Ensure window is properly closed; a Toplevel must not stop the parent's loop
+        if self.parent is None:
+            self.root.quit()
         self.root.destroy()
     
-    def generate_clustered_coordinates(self, cluster, spread_km=10):
-        """Generate coordinates within a cluster with realistic spread"""
-        lat_spread = spread_km / 111.0
-        lon_spread = spread_km / (111.0 * math.cos(math.radians(cluster["center_lat"])))
-        
-        latitude = cluster["center_lat"] + random.uniform(-lat_spread, lat_spread)
-        longitude = cluster["center_lon"] + random.uniform(-lon_spread, lon_spread)
-        return latitude, longitude
-    
-    def calculate_water_depth(self, latitude, longitude):
-        """Simulate water depth based on distance from shore"""
-        distance_factor = abs(latitude - 54.0) + abs(longitude - 1.0)
-        base_depth = 20 + (distance_factor * 5)
-        return round(base_depth + random.uniform(-5, 15), 1)
-    
-    def generate_turbine_data(self):
-        """Generate realistic turbine specifications"""
-        power_ratings = [2.0, 3.0, 3.6, 5.0, 6.0, 8.0]
-        power_rating = random.choice(power_ratings)
-        current_output_factor = random.uniform(0.7, 1.0)
-        
-        return {
-            "power_rating": power_rating,
-            "current_output": power_rating * current_output_factor,
-            "energy_price_mwh": random.uniform(45, 65)
-        }
-    
-    def generate_nodes_data(self, wind_farm_clusters, component_specs, base_installation_date):
-        """Generate node data with specified parameters"""
-        nodes_data = []
-        
-        for i in range(25):
-            cluster = random.choice(wind_farm_clusters)
-            latitude, longitude = self.generate_clustered_coordinates(cluster)
-            
-            turbine_data = self.generate_turbine_data()
-            water_depth = self.calculate_water_depth(latitude, longitude)
-            
-            # Generate components for this turbine
-            components = []
-            for comp_name, specs in component_specs.items():
-                # Use base installation date with some variation
-                comp_install_date = base_installation_date + datetime.timedelta(
-                    days=random.randint(-90, 90)
-                )
-                
-                # Some components might be replaced
-                if random.random() < 0.2:
-                    comp_install_date = base_installation_date + datetime.timedelta(
-                        days=random.randint(365, 3*365)
-                    )
-                
-                components.append({
-                    "name": comp_name,
-                    "lifetime_years": specs["lifetime_years"],
-                    "serial_number": f"{comp_name[:2].upper()}{i+1:02d}",
-                    "installation_date": comp_install_date,
-                    "replacement_cost": specs["replacement_cost"],
-                    "salvage_value": specs["salvage_value"],
-                    "criticality_level": specs["criticality_level"],
-                    "power_impact_factor": specs["power_impact_factor"],
-                    "repair_hours": specs["repair_hours"]
-                })
-            
-            nodes_data.append({
-                "node_id": f"WTG_{i+1:02d}",
-                "latitude": latitude,
-                "longitude": longitude,
-                "water_depth": water_depth,
-                "power_rating": turbine_data["power_rating"],
-                "current_output": turbine_data["current_output"],
-                "energy_price_mwh": turbine_data["energy_price_mwh"],
-                "cluster_name": cluster["name"],
-                "components": components
-            })
-        
-        return nodes_data
-    
-    def write_csv(self, nodes_data, filename):
-        """Write the generated data to CSV file"""
-        with open(filename, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                "Node_ID", "Latitude", "Longitude", "Water_Depth", "Power_Rating", 
-                "Current_Output", "Energy_Price_MWh", "Cluster_Name",
-                "Component_Name", "Lifetime_Years", "Serial_Number", "Installation_Date",
-                "Replacement_Cost", "Salvage_Value", "Criticality_Level", 
-                "Power_Impact_Factor", "Repair_Hours"
-            ])
-            
-            for node in nodes_data:
-                for component in node["components"]:
-                    writer.writerow([
-                        node["node_id"],
-                        node["latitude"],
-                        node["longitude"],
-                        node["water_depth"],
-                        node["power_rating"],
-                        node["current_output"],
-                        node["energy_price_mwh"],
-                        node["cluster_name"],
-                        component["name"],
-                        component["lifetime_years"],
-                        component["serial_number"],
-                        component["installation_date"],
-                        component["replacement_cost"],
-                        component["salvage_value"],
-                        component["criticality_level"],
-                        component["power_impact_factor"],
-                        component["repair_hours"]
-                    ])
-    
     def run(self):
-        """Run the GUI application"""
-        self.root.mainloop()
+        """Run the GUI application, returning once its window is closed"""
+        if self.parent is not None:
+            self.root.wait_window()
+        else:
+            self.root.mainloop()
 
 if __name__ == "__main__":
     app = DataMakerGUI()
@@ -1,6 +1,7 @@
 import csv
 import sys
 import datetime
+import logging
 import os
 import random
 import tkinter as tk
@@ -9,16 +10,52 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import Button, Slider, TextBox
 import numpy as np
 import math
+import itertools
 from functools import partial
 import matplotlib.patches as patches
 import matplotlib.transforms as transforms
 
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _greedy_route_order(costs, priorities):
+    """Greedy visiting order over candidates: start at the highest priority, then
+    repeatedly move to the unvisited candidate with the best priority / cost.
+    
+    costs is the candidates' square cost sub-matrix; returns candidate positions.
+    Ties go to the earliest candidate.
+    """
+    n = priorities.size
+    current = int(priorities.argmax())
+    order = [current]
+    # Visited candidates are masked out rather than deleted, so no step reallocates
+    visited = np.zeros(n, dtype=bool)
+    visited[current] = True
+    for _ in range(n - 1):
+        # Score every candidate against the current node at once
+        scores = priorities / np.maximum(costs[current], 1)
+        scores[visited] = -np.inf
+        current = int(scores.argmax())
+        visited[current] = True
+        order.append(current)
+    return np.array(order, dtype=np.intp)
+
 class Component:
     """Represents a component of a node (e.g., blade, gearbox)."""
+    # Fixed attribute layout: no per-instance __dict__ across thousands of components
+    __slots__ = ('node', 'name', 'lifetime_years', 'lifetime_days', 'serial_number',
+                 'installation_date', 'replacement_cost', 'salvage_value', 'criticality_level',
+                 'power_impact_factor', 'repair_hours', 'prediction_date', 'remaining_lifetime_days',
+                 'health_score', 'failure_probability', 'total_repair_cost', 'opportunity_cost',
+                 '_power_rating', '_energy_price', '_calc_key')
+
     def __init__(self, node, name, lifetime_years, serial_number, installation_date, 
                  replacement_cost=0, salvage_value=0, criticality_level="routine", 
-                 power_impact_factor=0, repair_hours=24, prediction_date=None):
-        self.node = node
+                 power_impact_factor=0, repair_hours=24, prediction_date=None,
+                 defer_calc=False):
+        self.link_node(node)
         self.name = name
         self.lifetime_years = lifetime_years
         self.lifetime_days = lifetime_years * 365
@@ -31,24 +68,40 @@ class Component:
         self.repair_hours = repair_hours
         self.prediction_date = prediction_date or datetime.date.today()
         
+        # Bulk loaders defer the derived properties to one vectorized Map update
+        if defer_calc:
+            self.remaining_lifetime_days = self.health_score = self.failure_probability = None
+            self.total_repair_cost = self.opportunity_cost = None
+            self._calc_key = None
+            return
+        
         # Calculate derived properties
         self.remaining_lifetime_days = self.calculate_remaining_lifetime()
         self.health_score = self.calculate_health_score()
         self.failure_probability = self.calculate_failure_probability()
         self.total_repair_cost = self.calculate_repair_cost()
         self.opportunity_cost = self.calculate_opportunity_cost()
+        self._calc_key = self._calculation_key()
+
+    def link_node(self, node):
+        """Attach this component to a node, caching the node rates used for opportunity cost."""
+        self.node = node
+        attributes = node.attributes if node else {}
+        self._power_rating = attributes.get('power_rating', 3.0)
+        self._energy_price = attributes.get('energy_price_mwh', 50.0)
 
     def calculate_remaining_lifetime(self):
         """Calculates the remaining operational days of the component."""
-        try:
-            days_in_service = (self.prediction_date - self.installation_date).days
-            return max(0, self.lifetime_days - days_in_service)
-        except AttributeError:
-            print(f"No installation date available for component {self.name}")
+        installation_date = self.installation_date
+        if installation_date is None:
+            logger.debug("No installation date available for component %s", self.name)
             return self.lifetime_days
-        except Exception as e:
-            print(f"Error calculating lifetime for {self.name}: {e}")
+        if not isinstance(installation_date, datetime.date):
+            logger.warning("Invalid installation date for %s: %r", self.name, installation_date)
             return 0
+        # Plain int ordinals avoid building a timedelta per component
+        days_in_service = self.prediction_date.toordinal() - installation_date.toordinal()
+        return max(0, self.lifetime_days - days_in_service)
 
     def calculate_health_score(self):
         """Calculate health score based on remaining lifetime (0-1 scale)."""
@@ -77,22 +130,32 @@ class Component:
     def calculate_opportunity_cost(self):
         """Calculate potential revenue loss due to component failure."""
         if self.failure_probability > 0 and self.node:
-            power_loss = self.node.attributes.get('power_rating', 3.0) * self.power_impact_factor
+            power_loss = self._power_rating * self.power_impact_factor
             hours_lost = self.repair_hours * self.failure_probability
-            energy_price = self.node.attributes.get('energy_price_mwh', 50.0)
             
-            return power_loss * hours_lost * energy_price
+            return power_loss * hours_lost * self._energy_price
         return 0
 
+    def _calculation_key(self):
+        """Every input the derived properties depend on, for change detection."""
+        return (self.prediction_date, self.installation_date, self.lifetime_days,
+                self.replacement_cost, self.salvage_value, self.power_impact_factor,
+                self.repair_hours, self._power_rating, self._energy_price)
+
     def update_calculations(self, prediction_date=None):
         """Recalculate all derived properties (useful when base data changes)."""
         if prediction_date:
             self.prediction_date = prediction_date
+        # Nothing to redo when neither the date nor any base data changed since last time
+        key = self._calculation_key()
+        if key == self._calc_key:
+            return
         self.remaining_lifetime_days = self.calculate_remaining_lifetime()
         self.health_score = self.calculate_health_score()
         self.failure_probability = self.calculate_failure_probability()
         self.total_repair_cost = self.calculate_repair_cost()
         self.opportunity_cost = self.calculate_opportunity_cost()
+        self._calc_key = key
 
     def __repr__(self):
         return (f"Component({self.name}, health={self.health_score:.2f}, "
@@ -101,9 +164,13 @@ class Component:
 
 class Node:
     """Represents a single node (e.g., a wind turbine) on the map."""
+    __slots__ = ('attributes', 'components', 'total_repair_cost', 'total_opportunity_cost',
+                 'repair_priority_score', '_version')
+
     def __init__(self, attributes=None, components=None):
         self.attributes = attributes if attributes else {}
         self.components = components if components else []
+        self._version = 0  # Bumped by touch() so the Map knows to rebuild its arrays
         
         # Calculate derived properties
         self.total_repair_cost = self.calculate_total_repair_cost()
@@ -116,10 +183,15 @@ class Node:
     def add_component(self, component):
         """Add a component to this node."""
         self.components.append(component)
-        component.node = self  # Link component back to node
+        component.link_node(self)  # Link component back to node
+        self.touch()
         # Recalculate totals
         self.update_calculations()
 
+    def touch(self):
+        """Mark this node's components as changed, e.g. after editing one in place."""
+        self._version += 1
+
     def calculate_total_repair_cost(self):
         """Calculate the total repair cost for all components in this node."""
         return sum(component.total_repair_cost for component in self.components)
@@ -146,13 +218,16 @@ class Node:
 
     def update_calculations(self, prediction_date=None):
         """Recalculate all derived properties for this node."""
-        # First update all components
+        # Update each component and accumulate the node totals in the same pass
+        total_repair_cost = 0
+        total_opportunity_cost = 0
         for component in self.components:
             component.update_calculations(prediction_date)
+            total_repair_cost += component.total_repair_cost
+            total_opportunity_cost += component.opportunity_cost
         
-        # Then update node totals
-        self.total_repair_cost = self.calculate_total_repair_cost()
-        self.total_opportunity_cost = self.calculate_total_opportunity_cost()
+        self.total_repair_cost = total_repair_cost
+        self.total_opportunity_cost = total_opportunity_cost
 
     def meets_repair_threshold(self, threshold_ratio=0.52):
         """Check if this node meets the minimum repair threshold criteria."""
@@ -194,6 +269,14 @@ class Map:
         self.selected_node_circle =  None
         self.node_circles = []  # To store node circles for visualization
         self.prediction_date = datetime.date.today()
+        self._component_soa = None  # Built lazily by _build_component_soa
+        self._fleet_update_key = None  # (prediction date, node versions) of the last bulk update
+        self._matrix_cache_key = None  # Node set and cost rate the matrices were built for
+        self._avg_transport_cost = 1000  # Default until a cost matrix is built
+        self._clusters = None  # Cluster name -> node indices, built lazily by _get_clusters
+        self._coords = None  # (N, 2) float32 latitude/longitude, built lazily by _get_coords
+        self._node_index = {id(node): i for i, node in enumerate(self.nodes)}  # Kept in step by add_node
+        self.priority_scores = None  # Per-node repair priority, in self.nodes order
 
         
         # --- Configuration for interactive UI fields ---
@@ -232,37 +315,123 @@ class Map:
     def add_node(self, node):
         """Add a node to the map."""
         self.nodes.append(node)
+        self._node_index[id(node)] = len(self.nodes) - 1
+        self._invalidate_node_caches()
+
+    def extend_nodes(self, nodes):
+        """Add several nodes to the map, invalidating the cached arrays once."""
+        start = len(self.nodes)
+        self.nodes.extend(nodes)
+        self._node_index.update((id(node), i) for i, node in enumerate(self.nodes[start:], start))
+        self._invalidate_node_caches()
+
+    def invalidate_components(self):
+        """Drop the component arrays so the next update re-reads every component."""
+        self._component_soa = None
+        self._fleet_update_key = None
+
+    def _invalidate_node_caches(self):
+        """Drop everything derived from the node list; each is rebuilt lazily."""
+        self.invalidate_components()
+        self._matrix_cache_key = None
+        self._clusters = None
+        self._coords = None
 
     def get_nodes(self):
         """Get all nodes on the map."""
         return self.nodes
     
+    def _get_clusters(self):
+        """Group node indices by cluster name, cached until nodes are added."""
+        if self._clusters is None:
+            clusters = {}
+            for i, node in enumerate(self.nodes):
+                clusters.setdefault(node.attributes.get('cluster_name', 'Unknown'), []).append(i)
+            self._clusters = clusters
+        return self._clusters
+    
+    def _get_coords(self):
+        """Node (latitude, longitude) pairs as an (N, 2) array, cached until nodes are added.
+        
+        Stored as float32: near 55 degrees latitude one step is about 3.8e-6
+        degrees (roughly 0.4 m), ample for plotting and the float32 distance matrix.
+        """
+        if self._coords is None:
+            coords = np.empty((len(self.nodes), 2), dtype=np.float32)
+            for i, node in enumerate(self.nodes):
+                attributes = node.attributes
+                coords[i] = attributes['latitude'], attributes['longitude']
+            self._coords = coords
+        return self._coords
+    
     def generate_cost_matrix(self):
         """Generate distance and cost matrices between all nodes."""
         num_nodes = len(self.nodes)
-        self.distance_matrix = np.zeros((num_nodes, num_nodes))
-        self.cost_matrix = np.zeros((num_nodes, num_nodes))
+        # Node positions never move, so the matrices only go stale when nodes
+        # are added or the cost rate changes
+        key = (id(self.nodes), num_nodes, self.cost_calculator.cost_per_distance_unit)
+        if self._matrix_cache_key == key:
+            return
+        
+        coords = self._get_coords()
+        
+        # Matrices are float32 to halve their memory and bandwidth
+        lat_r = np.deg2rad(coords[:, 0])
+        lon_r = np.deg2rad(coords[:, 1])
+        
+        # Great-circle (Haversine) distances in km for all pairs in one broadcast;
+        # the diagonal is exactly 0. Each step writes into one of two n x n
+        # buffers instead of allocating a fresh temporary.
+        cos_lat = np.cos(lat_r)
+        hav = np.subtract.outer(lon_r, lon_r)
+        hav /= 2
+        np.sin(hav, out=hav)
+        np.square(hav, out=hav)
+        hav *= np.multiply.outer(cos_lat, cos_lat)
+        dlat = np.subtract.outer(lat_r, lat_r)
+        dlat /= 2
+        np.sin(dlat, out=dlat)
+        np.square(dlat, out=dlat)
+        hav += dlat
+        del dlat
+        np.clip(hav, 0, 1, out=hav)
+        np.sqrt(hav, out=hav)
+        np.arcsin(hav, out=hav)
+        hav *= 2 * EARTH_RADIUS_KM
+        self.distance_matrix = hav
+        self.cost_matrix = self.cost_calculator.calculate_transportation_cost(
+            self.distance_matrix).astype(np.float32, copy=False)
         
-        for i in range(num_nodes):
-            for j in range(num_nodes):
-                if i != j:
-                    lat1, lon1 = self.nodes[i].attributes['latitude'], self.nodes[i].attributes['longitude']
-                    lat2, lon2 = self.nodes[j].attributes['latitude'], self.nodes[j].attributes['longitude']
-                    
-                    distance = np.sqrt((lat2 - lat1)**2 + (lon2 - lon1)**2)
-                    self.distance_matrix[i][j] = distance
-                    self.cost_matrix[i][j] = self.cost_calculator.calculate_transportation_cost(distance)
+        # Average cost of a trip between two distinct nodes, reused by priority scoring. The
+        # diagonal is the only structural zero, so the mean over the N*(N-1) off-diagonal
+        # entries is one sum with no mask or compacted copy.
+        if num_nodes > 1:
+            off_diagonal_sum = (self.cost_matrix.sum(dtype=np.float64)
+                                - np.trace(self.cost_matrix, dtype=np.float64))
+            self._avg_transport_cost = float(off_diagonal_sum / (num_nodes * (num_nodes - 1)))
+        else:
+            self._avg_transport_cost = 1000
         
-        print(f"Generated cost matrix for {num_nodes} nodes based on current cost settings.")
+        self._matrix_cache_key = key
+        logger.debug("Generated cost matrix for %d nodes based on current cost settings.", num_nodes)
 
     def calculate_all_repair_priorities(self):
         """Calculate repair priority scores for all nodes."""
-        avg_transport_cost = 1000  # Default value
-        if self.cost_matrix is not None and self.cost_matrix.size > 0:
-            avg_transport_cost = np.mean(self.cost_matrix[self.cost_matrix > 0])
+        avg_transport_cost = self._avg_transport_cost if self.cost_matrix is not None else 1000
         
-        for node in self.nodes:
-            node.calculate_repair_priority_score(avg_transport_cost)
+        # Same benefit/cost ratio as Node.calculate_repair_priority_score, for every node at once
+        num_nodes = len(self.nodes)
+        total_repair = np.fromiter((node.total_repair_cost for node in self.nodes),
+                                   dtype=np.float64, count=num_nodes)
+        total_opportunity = np.fromiter((node.total_opportunity_cost for node in self.nodes),
+                                        dtype=np.float64, count=num_nodes)
+        total_benefit = total_opportunity + total_repair * 0.5
+        total_cost = total_repair + avg_transport_cost
+        self.priority_scores = np.divide(total_benefit, total_cost, out=np.zeros(num_nodes),
+                                         where=total_cost > 0)
+        
+        for node, score in zip(self.nodes, self.priority_scores.tolist()):
+            node.repair_priority_score = score
     
     def filter_nodes_for_repair(self):
         """Filter nodes that meet the minimum repair threshold criteria."""
@@ -272,10 +441,131 @@ class Map:
         print(f"Filtered {len(worthy_nodes)} nodes above threshold ratio of {threshold}")
         return worthy_nodes
 
+    def _build_component_soa(self):
+        """Gather component inputs from every node into parallel numpy arrays.
+        
+        Components are laid out node by node, so each node owns one contiguous
+        segment starting at node_starts[i]. The arrays are a snapshot: they are
+        rebuilt when _node_versions() changes, i.e. when a node gains components
+        or is touch()ed. A component edited in place needs node.touch() or
+        invalidate_components() before the next update. Node rates are read from
+        node.attributes at build time.
+        """
+        components = [component for node in self.nodes for component in node.components]
+        counts = np.fromiter((len(node.components) for node in self.nodes),
+                             dtype=np.intp, count=len(self.nodes))
+        node_of_component = np.repeat(np.arange(len(self.nodes), dtype=np.int32), counts)
+        node_starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+        power_rating = np.array([node.attributes.get('power_rating', 3.0) for node in self.nodes],
+                                dtype=np.float32)
+        energy_price = np.array([node.attributes.get('energy_price_mwh', 50.0) for node in self.nodes],
+                                dtype=np.float32)
+        
+        # Same preconditions as Component.calculate_remaining_lifetime: components without
+        # an installation date are treated as brand new, and non-date values as worn out
+        install_dates = [c.installation_date for c in components]
+        has_install = np.array([d is not None for d in install_dates], dtype=bool)
+        valid_install = np.array([isinstance(d, datetime.date) for d in install_dates], dtype=bool)
+        for component in itertools.compress(components, has_install & ~valid_install):
+            logger.warning("Invalid installation date for %s: %r",
+                           component.name, component.installation_date)
+        install_ordinal = np.array([d.toordinal() if isinstance(d, datetime.date) else 0
+                                    for d in install_dates], dtype=np.int32)
+        
+        # Values are float32 (and day counts int32) to halve the bandwidth of the bulk
+        # update; node totals are still accumulated in float64
+        self._component_soa = {
+            'components': components,
+            'node_versions': self._node_versions(),
+            'node_of_component': node_of_component,
+            # reduceat needs non-empty segments; nodes without components keep a zero total
+            'segment_nodes': np.flatnonzero(counts),
+            'segment_starts': node_starts[counts > 0],
+            'lifetime_days': np.array([c.lifetime_days for c in components], dtype=np.int32),
+            'install_ordinal': install_ordinal,
+            'has_install': has_install,
+            'invalid_install': has_install & ~valid_install,
+            'replacement_cost': np.array([c.replacement_cost for c in components], dtype=np.float32),
+            'salvage_value': np.array([c.salvage_value for c in components], dtype=np.float32),
+            'power_impact_factor': np.array([c.power_impact_factor for c in components], dtype=np.float32),
+            'repair_hours': np.array([c.repair_hours for c in components], dtype=np.float32),
+            'power_rating': power_rating[node_of_component],
+            'energy_price': energy_price[node_of_component],
+        }
+        return self._component_soa
+
+    def _node_versions(self):
+        """Per-node (version, component count) pairs that the SoA snapshot was built from."""
+        return [(node._version, len(node.components)) for node in self.nodes]
+
+    def _update_component_calculations(self):
+        """Recompute every component's derived values, and node totals, in bulk.
+        
+        Mirrors the Component.calculate_* formulas on the SoA arrays and writes
+        the results back to the Component and Node objects for display.
+        """
+        versions = self._node_versions()
+        soa = self._component_soa
+        if soa is None or soa['node_versions'] != versions:
+            soa = self._build_component_soa()
+        (remaining, health, failure, repair_cost, opportunity_cost,
+         node_repair, node_opportunity) = self._compute_fleet_update(soa)
+        
+        for component, rem, h, f, rc, oc in zip(soa['components'], remaining.tolist(),
+                                                health.tolist(), failure.tolist(),
+                                                repair_cost.tolist(), opportunity_cost.tolist()):
+            component.prediction_date = self.prediction_date
+            component.remaining_lifetime_days = rem
+            component.health_score = h
+            component.failure_probability = f
+            component.total_repair_cost = rc
+            component.opportunity_cost = oc
+            # Bulk results are not what update_calculations would cache; force its next run
+            component._calc_key = None
+        for node, rc, oc in zip(self.nodes, node_repair.tolist(), node_opportunity.tolist()):
+            node.total_repair_cost = rc
+            node.total_opportunity_cost = oc
+        self._fleet_update_key = (self.prediction_date, versions)
+
+    def _compute_fleet_update(self, soa):
+        """Compute the fleet update with numpy array expressions."""
+        lifetime_days = soa['lifetime_days']
+        replacement_cost = soa['replacement_cost']
+        has_lifetime = lifetime_days > 0
+        
+        days_in_service = np.where(soa['has_install'],
+                                   self.prediction_date.toordinal() - soa['install_ordinal'], 0)
+        remaining = np.where(soa['invalid_install'], 0,
+                             np.maximum(0, lifetime_days - days_in_service))
+        health = np.divide(remaining, lifetime_days, out=np.zeros(remaining.shape, dtype=np.float32),
+                           where=has_lifetime)
+        failure = 1 - health ** 2
+        depreciation = np.where(has_lifetime,
+                                (replacement_cost - soa['salvage_value']) * (1 - health),
+                                replacement_cost)
+        repair_cost = replacement_cost * failure + depreciation
+        opportunity_cost = np.where(
+            failure > 0,
+            soa['power_rating'] * soa['power_impact_factor'] * soa['repair_hours'] * failure
+            * soa['energy_price'],
+            0.0)
+        
+        # Per-node totals in one segmented sum over the contiguous component runs
+        node_repair = np.zeros(len(self.nodes))
+        node_opportunity = np.zeros(len(self.nodes))
+        if soa['segment_starts'].size:
+            node_repair[soa['segment_nodes']] = np.add.reduceat(
+                repair_cost, soa['segment_starts'], dtype=np.float64)
+            node_opportunity[soa['segment_nodes']] = np.add.reduceat(
+                opportunity_cost, soa['segment_starts'], dtype=np.float64)
+        return remaining, health, failure, repair_cost, opportunity_cost, node_repair, node_opportunity
+
     def update_all_calculations(self):
         """Update all calculations for all nodes and components."""
-        for node in self.nodes:
-            node.update_calculations(self.prediction_date)
+        # Each stage is skipped when its inputs are unchanged: component values depend on
+        # the prediction date and the node versions, the matrices on the node set and cost rate
+        if self._fleet_update_key != (self.prediction_date, self._node_versions()):
+            self._update_component_calculations()
         
         if self.nodes:
             self.generate_cost_matrix()
@@ -284,14 +574,21 @@ class Map:
 
     def get_map_summary(self):
         """Get a summary of the entire map status."""
-        # Temporarily filter to get the count without printing the filter message
-        worthy_nodes = [node for node in self.nodes if node.meets_repair_threshold(self.repair_threshold_ratio)]
+        # Gather node values once and reduce them in numpy; the worthy count
+        # applies the same >= test as meets_repair_threshold, without printing
+        num_nodes = len(self.nodes)
+        repair_costs = np.fromiter((node.total_repair_cost for node in self.nodes),
+                                   dtype=np.float64, count=num_nodes)
+        opportunity_costs = np.fromiter((node.total_opportunity_cost for node in self.nodes),
+                                        dtype=np.float64, count=num_nodes)
+        priorities = np.fromiter((node.repair_priority_score for node in self.nodes),
+                                 dtype=np.float64, count=num_nodes)
         
         return {
-            'total_nodes': len(self.nodes),
-            'repair_worthy_nodes': len(worthy_nodes),
-            'total_repair_cost': sum(node.total_repair_cost for node in self.nodes),
-            'total_opportunity_cost': sum(node.total_opportunity_cost for node in self.nodes),
+            'total_nodes': num_nodes,
+            'repair_worthy_nodes': int(np.count_nonzero(priorities >= self.repair_threshold_ratio)),
+            'total_repair_cost': float(repair_costs.sum()),
+            'total_opportunity_cost': float(opportunity_costs.sum()),
             'repair_threshold': self.repair_threshold_ratio
         }
 
@@ -314,51 +611,93 @@ class Map:
         if not filtered_nodes:
             return []
         
-        unvisited_nodes = filtered_nodes[:]
-        current_node = max(unvisited_nodes, key=lambda node: node.repair_priority_score)
-        unvisited_nodes.remove(current_node)
-        path = [current_node]
+        # Cost-matrix rows are looked up by node identity instead of list.index() scans
+        idx_of = self._node_index
+        candidate_idx = np.array([idx_of[id(node)] for node in filtered_nodes], dtype=np.intp)
+        candidate_priority = np.array([node.repair_priority_score for node in filtered_nodes],
+                                      dtype=np.float64)
+        # Route only over the candidates' own cost sub-matrix
+        if self.cost_matrix is not None:
+            candidate_costs = self.cost_matrix[np.ix_(candidate_idx, candidate_idx)]
+        else:
+            candidate_costs = np.ones((candidate_idx.size, candidate_idx.size), dtype=np.float32)
         
-        while unvisited_nodes:
-            best_next_node = None
-            max_score = -1
-            current_node_index = self.nodes.index(current_node)
-            
-            for candidate_node in unvisited_nodes:
-                candidate_node_index = self.nodes.index(candidate_node)
-                transport_cost = self.cost_matrix[current_node_index][candidate_node_index] if self.cost_matrix is not None else 1
-                
-                score = candidate_node.repair_priority_score / max(transport_cost, 1)
-                
-                if score > max_score:
-                    max_score = score
-                    best_next_node = candidate_node
-            
-            if best_next_node:
-                unvisited_nodes.remove(best_next_node)
-                path.append(best_next_node)
-                current_node = best_next_node
-            else:
-                break
+        path_idx = candidate_idx[_greedy_route_order(candidate_costs, candidate_priority)].tolist()
+        
+        if self.distance_matrix is not None:
+            path_idx = self._refine_route_2opt(path_idx)
+        path = [self.nodes[i] for i in path_idx]
         
         print(f"Optimized route with {len(path)} nodes")
         return path
     
+    def _refine_route_2opt(self, path_idx):
+        """Shorten an open route with 2-opt segment reversals, keeping the start node fixed.
+        
+        For each edge (i, i+1), all later edges (j, j+1) are scored at once; the
+        best reversal of path[i+1..j] is applied until no move shortens the route.
+        Reversing up to the last stop only replaces edge (i, i+1), as the route is open.
+        """
+        route = np.array(path_idx, dtype=np.intp)
+        n = route.size
+        dist = self.distance_matrix
+        improved = True
+        while improved:
+            improved = False
+            for i in range(n - 2):
+                a, b = route[i], route[i + 1]
+                ends = route[i + 2:]
+                # Distance from each candidate j to its successor; zero past the last stop
+                end_next = np.zeros(ends.size)
+                end_next[:-1] = dist[ends[:-1], route[i + 3:]]
+                after_next = np.zeros(ends.size)
+                after_next[:-1] = dist[b, route[i + 3:]]
+                delta = (dist[a, ends] + after_next) - (dist[a, b] + end_next)
+                k = int(delta.argmin())
+                if delta[k] < -1e-9:
+                    j = i + 2 + k
+                    route[i + 1:j + 1] = route[i + 1:j + 1][::-1]
+                    improved = True
+        return route.tolist()
+    
     def draw_map(self):
         fig, self.map_ax = plt.subplots(figsize=(16, 12))
         plt.subplots_adjust(left=0.08, right=0.7, top=0.9, bottom=0.10)
 
-        latitudes = [node.attributes['latitude'] for node in self.nodes]
-        longitudes = [node.attributes['longitude'] for node in self.nodes]
-        
-        clusters = sorted(list({node.attributes.get('cluster_name', 'Unknown') for node in self.nodes}))
+        # Coordinates and clusters come from the cached per-node columns
+        coords = self._get_coords()
+        cluster_groups = self._get_clusters()
+        clusters = sorted(cluster_groups)
         # Use tab20 colormap to avoid red and have more color options
         colors = plt.cm.get_cmap('tab20', len(clusters))
         cluster_color_map = {cluster: colors(i) for i, cluster in enumerate(clusters)}
-        node_colors = [cluster_color_map[node.attributes.get('cluster_name', 'Unknown')] for node in self.nodes]
+        # Colors are built as one (N, 4) RGBA array, filled per cluster
+        node_colors = np.empty((len(self.nodes), 4))
+        for cluster, indices in cluster_groups.items():
+            node_colors[indices] = cluster_color_map[cluster]
 
-        self.scatter = self.map_ax.scatter(latitudes, longitudes, c=node_colors, s=100, alpha=0.8, picker=True)
-        self.original_colors = node_colors.copy()  # Store original colors for resetting
+        # Scalar size and a single default color keep scatter's setup on its uniform
+        # path; the per-node RGBA array is then installed directly as facecolors
+        self.scatter = self.map_ax.scatter(coords[:, 0], coords[:, 1], s=100, alpha=0.8, picker=True)
+        self.scatter.set_facecolors(node_colors)
+        # Click hit radius in pixels: the marker radius (sqrt of s, halved) converted from points
+        pick_radius_px = math.sqrt(100) / 2 * fig.dpi / 72
+        self._pick_points = None  # Node positions in display coords, rebuilt on zoom/pan/resize
+        # The selected node is marked by a red marker drawn over the scatter, so a click
+        # moves one point instead of recoloring the scatter
+        self.selected_node_circle = self.map_ax.scatter([], [], c='red', s=100,
+                                                        visible=False, animated=True)
+        
+        # Route artists are created once, hidden, and refilled for each generated pathway.
+        # They are animated so a new route can be blitted over the cached map background.
+        self._route_line, = self.map_ax.plot([], [], 'r-o', linewidth=2, markersize=8,
+                                             label='Optimized Route', visible=False, animated=True)
+        self._start_marker = self.map_ax.scatter([], [], c='lime', s=250, marker='*', label='Start Point',
+                                                 zorder=5, visible=False, animated=True)
+        self._end_marker = self.map_ax.scatter([], [], c='red', s=200, marker='X', label='End Point',
+                                               zorder=5, visible=False, animated=True)
+        route_artists = (self._route_line, self._start_marker, self._end_marker)
+        overlay_artists = (self.selected_node_circle,) + route_artists
         
         self.map_ax.set_title("Maintenance Priority Overview Map", fontsize=16)
         self.map_ax.set_xlabel("Latitude")
@@ -405,11 +744,44 @@ class Map:
             text_boxes[key] = text_box
             field_y_pos -= 0.06 # Decrement y-position for the next field
 
+        # The details text is created once and redrawn by blitting: a full
+        # canvas draw caches the panel background, and updates only restore
+        # that region and repaint the text. The region reaches below the
+        # panel axes because long component lists overflow it.
+        panel_text = info_panel_ax.text(0.05, 0.95, "", transform=info_panel_ax.transAxes,
+                                        fontsize=9, verticalalignment='top', fontfamily='monospace',
+                                        wrap=True, animated=True)
+        panel_region = transforms.TransformedBbox(
+            transforms.Bbox.from_extents(0.70, 0.42, 1.0, 1.0), fig.transFigure)
+        self._panel_bg = None
+        self._map_bg = None
+        canvas = fig.canvas
+
+        def on_draw(event):
+            # Saving a figure already includes animated artists
+            if event.canvas.is_saving():
+                return
+            # A screen draw skips them: cache the backgrounds for blitting, then paint them
+            if event.canvas is canvas and canvas.supports_blit:
+                self._panel_bg = canvas.copy_from_bbox(panel_region)
+                self._map_bg = canvas.copy_from_bbox(self.map_ax.bbox)
+            panel_text.draw(event.renderer)
+            for artist in overlay_artists:
+                if artist.get_visible():
+                    artist.draw(event.renderer)
+
+        def blit_map():
+            """Repaint the selection and route over the cached map background."""
+            if self._map_bg is None or not fig.canvas.supports_blit:
+                fig.canvas.draw_idle()
+                return
+            fig.canvas.restore_region(self._map_bg)
+            for artist in overlay_artists:
+                if artist.get_visible():
+                    self.map_ax.draw_artist(artist)
+            fig.canvas.blit(self.map_ax.bbox)
+
         def update_info_panel(node):
-            info_panel_ax.clear()
-            info_panel_ax.set_title("Node Details")
-            info_panel_ax.axis('off')
-            
             if node:
                 info_text = (f"Node ID: {node.attributes.get('node_id', 'N/A')}\n"
                              f"Cluster: {node.attributes.get('cluster_name', 'N/A')}\n"
@@ -429,30 +801,54 @@ class Map:
             else:
                 all_text = "Click on a node to see details."
             
-            info_panel_ax.text(0.05, 0.95, all_text, transform=info_panel_ax.transAxes, 
-                               fontsize=9, verticalalignment='top', fontfamily='monospace', wrap=True)
-            fig.canvas.draw_idle()
+            panel_text.set_text(all_text)
+            if self._panel_bg is None or not fig.canvas.supports_blit:
+                fig.canvas.draw_idle()
+                return
+            fig.canvas.restore_region(self._panel_bg)
+            info_panel_ax.draw_artist(panel_text)
+            fig.canvas.blit(panel_region)
+
+        def invalidate_pick_points(*_):
+            self._pick_points = None
 
         def on_click(event):
-            if event.inaxes == self.map_ax:
-                contains, index_info = self.scatter.contains(event)
-                if contains:
-                    node_index = index_info['ind'][0]
+            if event.inaxes == self.map_ax and self.nodes:
+                if self._pick_points is None:
+                    self._pick_points = self.map_ax.transData.transform(self.scatter.get_offsets())
+                # Nearest node to the click in pixel space, accepted within the marker radius
+                sq_dist = ((self._pick_points - (event.x, event.y)) ** 2).sum(axis=1)
+                node_index = int(sq_dist.argmin())
+                if sq_dist[node_index] <= pick_radius_px ** 2:
                     self.selected_node = self.nodes[node_index]
                     update_info_panel(self.selected_node)
 
-                    # Reset all nodes to original colors
-                    current_colors = self.original_colors.copy()
-                    # Set selected node to red
-                    current_colors[node_index] = 'red'
-                    self.scatter.set_color(current_colors)
-                    
-                    fig.canvas.draw_idle()
+                    # Move the red selection marker onto the new node
+                    self.selected_node_circle.set_offsets(self.scatter.get_offsets()[node_index:node_index + 1])
+                    self.selected_node_circle.set_visible(True)
+                    blit_map()
 
 
+        def clear_route():
+            """Hide the route artists and remove any others; True if the background changed."""
+            if not self.path_artists:
+                print("Map is already clear. Nothing to reset.")
+                return False
+            
+            print("Resetting map view...")
+            background_changed = False
+            for artist in self.path_artists:
+                if artist in route_artists:
+                    artist.set_visible(False)
+                else:
+                    artist.remove()
+                    background_changed = True
+            self.path_artists.clear()
+            return background_changed
+
         def generate_pathway_action(event):
             print("\n=== GENERATING OPTIMIZED MAINTENANCE PATHWAY ===")
-            reset_map_action(event) # Clear previous path before drawing a new one
+            full_redraw = clear_route() # Clear previous path before drawing a new one
 
             self.update_all_calculations()
             worthy_nodes = self.filter_nodes_for_repair()
@@ -467,20 +863,32 @@ class Map:
                 fig.canvas.draw_idle()
                 return
             
-            path_lat = [node.attributes['latitude'] for node in optimized_path]
-            path_lon = [node.attributes['longitude'] for node in optimized_path]
+            path_coords = self._get_coords()[[self._node_index[id(node)] for node in optimized_path]]
             
-            route_line, = self.map_ax.plot(path_lat, path_lon, 'r-o', linewidth=2, markersize=8, label='Optimized Route')
-            start_marker = self.map_ax.scatter(path_lat[0], path_lon[0], c='lime', s=250, marker='*', label='Start Point', zorder=5)
-            self.path_artists.extend([route_line, start_marker])
+            self._route_line.set_data(path_coords[:, 0], path_coords[:, 1])
+            self._start_marker.set_offsets(path_coords[:1])
+            self.path_artists.extend([self._route_line, self._start_marker])
             
-            if len(path_lat) > 1:
-                end_marker = self.map_ax.scatter(path_lat[-1], path_lon[-1], c='red', s=200, marker='X', label='End Point', zorder=5)
-                self.path_artists.append(end_marker)
+            if len(path_coords) > 1:
+                self._end_marker.set_offsets(path_coords[-1:])
+                self.path_artists.append(self._end_marker)
+            for artist in self.path_artists:
+                artist.set_visible(True)
 
+            # The legend is part of the cached background, so only a changed legend
+            # (first route, or a one-stop route) needs a full redraw
             handles, labels = self.map_ax.get_legend_handles_labels()
-            self.map_ax.legend(handles, labels)
-            fig.canvas.draw_idle()
+            shown = [(h, l) for h, l in zip(handles, labels) if h.get_visible()]
+            legend = self.map_ax.get_legend()
+            legend_labels = [t.get_text() for t in legend.get_texts()] if legend else None
+            if legend_labels != [l for _, l in shown]:
+                self.map_ax.legend([h for h, _ in shown], [l for _, l in shown])
+                full_redraw = True
+            
+            if full_redraw:
+                fig.canvas.draw_idle()
+            else:
+                blit_map()
             
             total_benefit = sum(n.total_opportunity_cost + n.total_repair_cost * 0.5 for n in optimized_path)
             total_cost = sum(n.total_repair_cost for n in optimized_path)
@@ -493,20 +901,17 @@ class Map:
 
         def reset_map_action(event):
             """Clears the generated path and markers from the map."""
-            if not self.path_artists:
-                print("Map is already clear. Nothing to reset.")
+            was_clear = not self.path_artists
+            clear_route()
+            if was_clear:
                 return
             
-            print("Resetting map view...")
-            for artist in self.path_artists:
-                artist.remove()
-            self.path_artists.clear()
-            
             # Redraw legend without path elements
             handles, labels = self.map_ax.get_legend_handles_labels()
-            # Filter out the labels associated with the path
-            filtered_handles = [h for h, l in zip(handles, labels) if l not in ['Optimized Route', 'Start Point', 'End Point']]
-            filtered_labels = [l for l in labels if l not in ['Optimized Route', 'Start Point', 'End Point']]
+            # Filter out the labels associated with the path in one pass
+            path_labels = {'Optimized Route', 'Start Point', 'End Point'}
+            filtered = [(h, l) for h, l in zip(handles, labels) if l not in path_labels]
+            filtered_handles, filtered_labels = zip(*filtered) if filtered else ([], [])
             self.map_ax.legend(filtered_handles, filtered_labels, title="Clusters")
 
             fig.canvas.draw_idle()
@@ -514,6 +919,10 @@ class Map:
         generate_button.on_clicked(generate_pathway_action)
         reset_button.on_clicked(reset_map_action)
         fig.canvas.mpl_connect('button_press_event', on_click)
+        fig.canvas.mpl_connect('draw_event', on_draw)
+        self.map_ax.callbacks.connect('xlim_changed', invalidate_pick_points)
+        self.map_ax.callbacks.connect('ylim_changed', invalidate_pick_points)
+        fig.canvas.mpl_connect('resize_event', invalidate_pick_points)
         update_info_panel(None)
         plt.show()
 
@@ -521,7 +930,7 @@ class Map:
         """A generic callback factory for handling text box submissions."""
         try:
             if value_type == 'date':
-                new_value = datetime.datetime.strptime(text, '%Y-%m-%d').date()
+                new_value = datetime.date.fromisoformat(text)
                 # Validate that the date is not before today
                 if new_value < datetime.date.today():
                     messagebox.showerror("Invalid Date", "Prediction date cannot be before today's date.")
@@ -552,12 +961,12 @@ class Map:
 class CostCalculator:
     """Handles all cost calculations for maintenance operations."""
     def __init__(self):
-        self.cost_per_distance_unit = 5.0  # $5 per unit distance
+        self.cost_per_distance_unit = 5.0  # $5 per km
         self.base_crew_cost_per_day = 2000
         self.base_vessel_cost_per_day = 5000
         
     def calculate_transportation_cost(self, distance):
-        """Calculate cost based on distance traveled."""
+        """Calculate cost based on distance traveled (a scalar or a numpy array of distances)."""
         return distance * self.cost_per_distance_unit
     
     def calculate_operation_cost(self, repair_hours):
@@ -565,71 +974,109 @@ class CostCalculator:
         days_for_repair = math.ceil(repair_hours / 24.0)
         return (self.base_crew_cost_per_day + self.base_vessel_cost_per_day) * days_for_repair
 
-def load_data_from_csv(file_path):
-    """Loads node and component data from a CSV file."""
-    with open(file_path, mode='r', encoding='utf-8') as file:
+def _read_csv_columns(file_path):
+    """Read the node CSV as a list of columns, using pyarrow's reader when installed.
+    
+    pyarrow tokenizes and converts in parallel native threads; without it the csv
+    module is used. Text columns, and the coordinates the loader keys nodes on,
+    are kept as strings either way.
+    """
+    with open(file_path, mode='r', encoding='utf-8', newline='') as file:
         reader = csv.reader(file)
         header = next(reader)
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            rows = list(reader)
+            return list(zip(*rows)) if rows else [()] * len(header)
+    
+    # Node_ID, Latitude, Longitude, Cluster_Name, Component_Name, Serial_Number, Criticality_Level
+    text_positions = (0, 1, 2, 7, 8, 10, 14)
+    table = pacsv.read_csv(file_path, convert_options=pacsv.ConvertOptions(
+        column_types={header[i]: pa.string() for i in text_positions}))
+    return [column.to_pylist() if i in text_positions else column.to_numpy()
+            for i, column in enumerate(table.columns)]
+
+def load_data_from_csv(file_path):
+    """Loads node and component data from a CSV file."""
+    # Parse column-at-a-time: each numeric column is converted by numpy in one call
+    columns = _read_csv_columns(file_path)
+    num_rows = len(columns[0])
+    (node_ids, latitude_strs, longitude_strs, water_depths, power_ratings,
+     current_outputs, energy_prices, cluster_names,
+     component_names, lifetime_years, serial_numbers, installation_date_strs,
+     replacement_costs, salvage_values, criticality_levels,
+     power_impact_factors, repair_hours) = columns
+    
+    def to_floats(column):
+        return np.array(column, dtype=np.float64).tolist()
+    
+    latitudes, longitudes = to_floats(latitude_strs), to_floats(longitude_strs)
+    water_depths, power_ratings = to_floats(water_depths), to_floats(power_ratings)
+    current_outputs, energy_prices = to_floats(current_outputs), to_floats(energy_prices)
+    lifetime_years = np.array(lifetime_years, dtype=np.int64).tolist()
+    
+    # Dates are parsed in one vectorized pass and share a single today()
+    today = datetime.date.today()
+    installation_dates = np.array(installation_date_strs, dtype='datetime64[D]')
+    # Blank (or 'NaT') cells parse to NaT; reject them as the per-row strptime did
+    missing_dates = np.flatnonzero(np.isnat(installation_dates))
+    if missing_dates.size:
+        raise ValueError(f"{missing_dates.size} row(s) have no installation date "
+                         f"(first on line {missing_dates[0] + 2} of {file_path})")
+    installation_dates = installation_dates.tolist()
+    replacement_costs, salvage_values = to_floats(replacement_costs), to_floats(salvage_values)
+    power_impact_factors, repair_hours = to_floats(power_impact_factors), to_floats(repair_hours)
+    
+    # Consecutive rows sharing a node key (id + raw coordinates) belong to one node;
+    # group boundaries are found by comparing each key column with its shifted self
+    key_changes = np.zeros(num_rows, dtype=bool)
+    key_changes[:1] = True
+    for key_column in (node_ids, latitude_strs, longitude_strs):
+        key_column = np.asarray(key_column)
+        key_changes[1:] |= key_column[1:] != key_column[:-1]
+    group_starts = np.flatnonzero(key_changes).tolist()
+    
+    nodes = []
+    for first, end in zip(group_starts, group_starts[1:] + [num_rows]):
+        row_indices = range(first, end)
+        node_key = (node_ids[first], latitude_strs[first], longitude_strs[first])
+        node_obj = Node(attributes={
+            "node_key": node_key, "node_id": node_ids[first],
+            "latitude": latitudes[first], "longitude": longitudes[first],
+            "water_depth": water_depths[first], "power_rating": power_ratings[first],
+            "current_output": current_outputs[first], "energy_price_mwh": energy_prices[first],
+            "cluster_name": cluster_names[first]
+        })
         
-        nodes = []
-        current_node_attributes = None
-        components_for_current_node = []
-        
-        for row in reader:
-            (node_id, latitude, longitude, water_depth, power_rating, 
-             current_output, energy_price_mwh, cluster_name,
-             component_name, lifetime_years, serial_number, installation_date_str,
-             replacement_cost, salvage_value, criticality_level, 
-             power_impact_factor, repair_hours) = row
-            
-            # A unique key to identify a node based on its core properties
-            node_key = (node_id, latitude, longitude)
-            
-            if current_node_attributes is None or current_node_attributes['node_key'] != node_key:
-                # If we have collected components, finalize the previous node
-                if current_node_attributes is not None:
-                    node_obj = Node(attributes=current_node_attributes)
-                    for comp in components_for_current_node:
-                        node_obj.add_component(comp)
-                    nodes.append(node_obj)
-                
-                # Start a new node
-                current_node_attributes = {
-                    "node_key": node_key, "node_id": node_id,
-                    "latitude": float(latitude), "longitude": float(longitude),
-                    "water_depth": float(water_depth), "power_rating": float(power_rating),
-                    "current_output": float(current_output), "energy_price_mwh": float(energy_price_mwh),
-                    "cluster_name": cluster_name
-                }
-                components_for_current_node = []
-            
-            # Add the component for the current node
-            component = Component(
-                node=None, # Will be linked when the node is finalized
-                name=component_name,
-                lifetime_years=int(lifetime_years),
-                serial_number=serial_number,
-                installation_date=datetime.datetime.strptime(installation_date_str, "%Y-%m-%d").date(),
-                replacement_cost=float(replacement_cost),
-                salvage_value=float(salvage_value),
-                criticality_level=criticality_level,
-                power_impact_factor=float(power_impact_factor),
-                repair_hours=float(repair_hours),
-                prediction_date=datetime.date.today()
+        # Components are linked at construction; their derived values and the
+        # node totals are filled in by one bulk update once the map is built
+        node_obj.components.extend(
+            Component(
+                node=node_obj,
+                name=component_names[i],
+                lifetime_years=lifetime_years[i],
+                serial_number=serial_numbers[i],
+                installation_date=installation_dates[i],
+                replacement_cost=replacement_costs[i],
+                salvage_value=salvage_values[i],
+                criticality_level=criticality_levels[i],
+                power_impact_factor=power_impact_factors[i],
+                repair_hours=repair_hours[i],
+                prediction_date=today,
+                defer_calc=True
             )
-            components_for_current_node.append(component)
-        
-        # Add the last processed node
-        if current_node_attributes is not None:
-            node_obj = Node(attributes=current_node_attributes)
-            for comp in components_for_current_node:
-                node_obj.add_component(comp)
-            nodes.append(node_obj)
-            
-        asset_map = Map(nodes)
-        print(f"Loaded {len(asset_map.get_nodes())} nodes from file.")
-        print(f"Total components: {sum(len(node.components) for node in nodes)}")
-        return asset_map
+            for i in row_indices
+        )
+        nodes.append(node_obj)
+        
+    asset_map = Map()
+    asset_map.extend_nodes(nodes)
+    asset_map._update_component_calculations()
+    print(f"Loaded {len(asset_map.get_nodes())} nodes from file.")
+    print(f"Total components: {sum(len(node.components) for node in nodes)}")
+    return asset_map
 
 def show_startup_instructions(file_path=None):
     """Displays a modal dialog with instructions and data source options."""
@@ -696,8 +1143,8 @@ def show_startup_instructions(file_path=None):
             from datamaker import DataMakerGUI
             root.withdraw()  # Hide current window
             
-            # Create and run datamaker
-            datamaker = DataMakerGUI()
+            # Create and run datamaker as a window of this app
+            datamaker = DataMakerGUI(parent=root)
             datamaker.run()
             
             # Check if a file was created